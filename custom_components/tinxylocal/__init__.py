@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .const import CONF_DEVICE, CONF_MQTT_PASS, DOMAIN
 from .coordinator import TinxyUpdateCoordinator
@@ -19,17 +21,11 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.SWITCH, Platform.NUMBER]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Tinxy from a config entry."""
-
-    hass.data.setdefault(DOMAIN, {})
-
-    web_session = async_get_clientsession(hass)
-
-    # Extract device configurations
+def _build_nodes(entry: ConfigEntry) -> list[dict]:
+    """Build the node descriptions from a config entry."""
     device_data = entry.data[CONF_DEVICE]
 
-    nodes = [
+    return [
         {
             "ip_address": entry.data[CONF_HOST],
             "mqtt_password": entry.data[CONF_MQTT_PASS],
@@ -46,14 +42,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }
     ]
 
-    # Initialize TinxyLocalHub instances for each node
-    hubs = [TinxyLocalHub(node["ip_address"]) for node in nodes]
 
-    # Initialize the coordinator with the list of nodes and web session
-    coordinator = TinxyUpdateCoordinator(hass, nodes, web_session)
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Tinxy from a config entry."""
+
+    hass.data.setdefault(DOMAIN, {})
 
-    # Store the coordinator and hubs in Home Assistant's data store
-    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator, "hubs": hubs}
+    # Guard against re-entrant setup of the same entry
+    if entry.entry_id in hass.data[DOMAIN]:
+        return True
+
+    # Dedicated session with keep-alive tuned for polling the same LAN
+    # device every few seconds: one persistent connection per host.
+    web_session = async_create_clientsession(
+        hass,
+        connector=aiohttp.TCPConnector(
+            limit=32, limit_per_host=1, keepalive_timeout=30
+        ),
+    )
+
+    # Build the node descriptions, reusing a cached copy across reloads
+    nodes_cache = hass.data[DOMAIN].setdefault("_nodes", {})
+    if (nodes := nodes_cache.get(entry.entry_id)) is None:
+        nodes = nodes_cache[entry.entry_id] = _build_nodes(entry)
+
+    # Initialize TinxyLocalHub instances for each node, sharing one session
+    hubs = [TinxyLocalHub(node["ip_address"], web_session) for node in nodes]
+
+    # Initialize the coordinator with the list of nodes and their hubs
+    coordinator = TinxyUpdateCoordinator(hass, nodes, hubs)
+
+    # Store the coordinator, hubs and session in Home Assistant's data store
+    hass.data[DOMAIN][entry.entry_id] = {
+        "coordinator": coordinator,
+        "hubs": hubs,
+        "session": web_session,
+    }
 
     # Forward the entry setup to the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -63,7 +87,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+        return True
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Stop any scheduled refresh before the coordinator goes away
+        await entry_data["coordinator"].async_shutdown()
+        await entry_data["session"].close()
+        hass.data[DOMAIN].get("_nodes", {}).pop(entry.entry_id, None)
     return unload_ok
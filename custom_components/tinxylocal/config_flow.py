@@ -49,15 +49,14 @@ STEP_DEVICE_DATA_SCHEMA = vol.Schema(
 
 async def validate_device(hass: HomeAssistant, host_ip, chip_id) -> dict[str, Any]:
     """Validate the device IP and selected device."""
-    web_session = async_get_clientsession(hass)
-    hub = TinxyLocalHub(host_ip)
-    return hub.validate_ip(web_session, host_ip, chip_id)
+    hub = TinxyLocalHub(host_ip, async_get_clientsession(hass))
+    return await hub.validate_ip(chip_id)
 
 
 async def read_devices(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Read Device List."""
     web_session = async_get_clientsession(hass)
-    _LOGGER.info(data)
+    _LOGGER.debug("Reading device list from the Tinxy cloud")
 
     host_config = TinxyHostConfiguration(
         api_token=data[CONF_API_KEY], api_url=TINXY_BACKEND
@@ -69,23 +68,14 @@ async def read_devices(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, A
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the API key and fetch device list."""
-    web_session = async_get_clientsession(hass)
-    hub = TinxyLocalHub(TINXY_BACKEND)
+    hub = TinxyLocalHub(TINXY_BACKEND, async_get_clientsession(hass))
 
-    if not await hub.authenticate(data[CONF_API_KEY], web_session):
+    if not await hub.authenticate(data[CONF_API_KEY]):
         raise InvalidAuth
 
     return {"title": "Tinxy.in"}
 
 
-def find_device_by_id(devicelist, target_id):
-    """Find device by its ID in the list."""
-    for device in devicelist:
-        if device["_id"] == target_id:
-            return device
-    return None
-
-
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Tinxy Local."""
 
@@ -95,6 +85,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self.api_token = None
         self.cloud_devices = {}
+        self._devices_by_id: dict[str, Any] = {}
+        self._device_options: dict[str, str] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -167,29 +159,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.cloud_devices = await read_devices(
                 self.hass, {CONF_API_KEY: self.api_token}
             )
-
-        # Build the selection schema
-        device_options = {
-            item["_id"]: "{} ({})".format(item["name"], item["uuidRef"]["uuid"])
-            for item in self.cloud_devices
-            if "mqttPassword" in item
-            and "uuidRef" in item
-            and "uuid" in item["uuidRef"]
-        }
+            self._devices_by_id = {d["_id"]: d for d in self.cloud_devices}
+            # Build the selection options once; re-renders reuse them
+            self._device_options = {
+                item["_id"]: f'{item["name"]} ({item["uuidRef"]["uuid"]})'
+                for item in self.cloud_devices
+                if "mqttPassword" in item
+                and "uuid" in item.get("uuidRef", {})
+            }
 
         if user_input:
             try:
-                selected_device = find_device_by_id(
-                    self.cloud_devices, user_input[CONF_DEVICE_ID]
-                )
+                selected_device = self._devices_by_id.get(user_input[CONF_DEVICE_ID])
 
                 if not selected_device:
                     raise ValueError("Device not found")  # noqa: TRY301
 
-                web_session = async_get_clientsession(self.hass)
-                hub = TinxyLocalHub(user_input[CONF_HOST])
+                hub = TinxyLocalHub(
+                    user_input[CONF_HOST], async_get_clientsession(self.hass)
+                )
                 validate_status = await hub.validate_ip(
-                    web_session,
                     selected_device["uuidRef"]["uuid"],
                 )
 
@@ -197,9 +186,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 if validate_status == "wrong_chip_id":
                     raise ValueError(  # noqa: TRY301
-                        "Wrong Ip address, chip id should be {}".format(
-                            selected_device["uuidRef"]["uuid"]
-                        )
+                        f"Wrong Ip address, chip id should be {selected_device['uuidRef']['uuid']}"
                     )
 
                 if validate_status == "api_not_available":
@@ -232,7 +219,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show device selection form with IP configuration
         device_schema = vol.Schema(
             {
-                vol.Required(CONF_DEVICE_ID): vol.In(device_options),
+                vol.Required(CONF_DEVICE_ID): vol.In(self._device_options),
                 vol.Required(CONF_HOST): str,
             }
         )
@@ -1,18 +1,31 @@
 """Tinxy Node Update Coordinator."""
 
+import asyncio
+from collections import Counter
 from datetime import timedelta
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .hub import TinxyConnectionException, TinxyLocalException, TinxyLocalHub
 
 _LOGGER = logging.getLogger(__name__)
+# Cooldown for entity-requested refreshes: a scene toggling several
+# switches collapses into a single poll instead of one per entity.
 REQUEST_REFRESH_DELAY = 0.50
+# Maximum number of nodes polled concurrently; the ESP-class devices run
+# single-threaded HTTP servers and bursting beyond this slows the cycle.
+MAX_CONCURRENT_POLLS = 8
+# After this many unchanged polls the interval starts backing off, up to
+# MAX_IDLE_INTERVAL seconds; any observed change snaps back to the
+# configured minimum.
+IDLE_BACKOFF_CYCLES = 3
+MAX_IDLE_INTERVAL = 30
 
 
 class TinxyUpdateCoordinator(DataUpdateCoordinator):
@@ -22,7 +35,7 @@ class TinxyUpdateCoordinator(DataUpdateCoordinator):
     nodes: list[dict[str, Any]]
 
     def __init__(
-        self, hass: HomeAssistant, nodes: list[dict[str, Any]], web_session
+        self, hass: HomeAssistant, nodes: list[dict[str, Any]], hubs: list[TinxyLocalHub]
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -30,24 +43,81 @@ class TinxyUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Tinxy Nodes",
             update_interval=timedelta(seconds=5),  # Default fallback interval
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_DELAY, immediate=False
+            ),
         )
         self.hass = hass
         self.nodes = nodes  # Type-annotated as a list of dictionaries
-        self.web_session = web_session
-        self.hubs = [TinxyLocalHub(node["ip_address"]) for node in nodes]
-        self.device_polling_intervals = {node["device_id"]: 5 for node in nodes}  # Default 5 seconds
+        self.hubs = hubs
+        # Pre-materialized pairs and registration arguments so the 5-second
+        # poll loop does not re-zip lists or re-probe node dicts.
+        self._hub_node_pairs = list(zip(hubs, nodes, strict=True))
+        self._registration_args = [
+            (node["device_id"], node["name"], {(DOMAIN, node["device_id"])})
+            for node in nodes
+        ]
+        self._node_ids = [node["device_id"] for node in nodes]
+        self.device_polling_intervals = {device_id: 5 for device_id in self._node_ids}  # Default 5 seconds
+        self._interval_counts = Counter(self.device_polling_intervals.values())
+        self._min_interval = 5
         self.device_metadata = {}  # Type-annotated as a dictionary
+        # Per-relay device dicts keyed by (device_id, relay_number), rebuilt
+        # each poll so entities resolve their slice with one hash lookup.
+        self.relay_index: dict[tuple[str, int], dict[str, Any]] = {}
+        # Last-seen metadata values per device, used to skip rebuilding the
+        # metadata dict on polls where nothing changed.
+        self._metadata_keys: dict[str, tuple[Any, ...]] = {}
+        # Device ids already upserted into the device registry.
+        self._devices_registered: set[str] = set()
+        self._poll_semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._last_state_signature: tuple[Any, ...] | None = None
+        self._idle_cycles = 0
+
+    async def _fetch_bounded(self, hub: TinxyLocalHub, node: dict[str, Any]):
+        """Fetch one node's data while holding the concurrency semaphore."""
+        async with self._poll_semaphore:
+            return await hub.fetch_device_data(node)
 
     async def _async_update_data(self):
         """Fetch data from each configured Tinxy node."""
         status_list = {}
-        for hub, node in zip(self.hubs, self.nodes, strict=False):
-            try:
-                device_data = await hub.fetch_device_data(node, self.web_session)
-                if device_data:
-                    status_list[node["device_id"]] = device_data
-                    # Populate device metadata for other information (firmware, model, etc.)
-                    self.device_metadata[node["device_id"]] = {
+        results = await asyncio.gather(
+            *(
+                self._fetch_bounded(hub, node)
+                for hub, node in self._hub_node_pairs
+            ),
+            return_exceptions=True,
+        )
+        for node, device_data in zip(self.nodes, results, strict=False):
+            if isinstance(device_data, TinxyConnectionException):
+                _LOGGER.error(
+                    "Connection error for node %s: %s", node["name"], device_data
+                )
+                continue
+            if isinstance(device_data, TinxyLocalException):
+                _LOGGER.error(
+                    "Error communicating with node %s: %s", node["name"], device_data
+                )
+                continue
+            if isinstance(device_data, BaseException):
+                raise device_data
+            if device_data:
+                device_id = node["device_id"]
+                status_list[device_id] = device_data
+                # Populate device metadata for other information (firmware, model,
+                # etc.), but only rebuild the dict when a value actually changed.
+                metadata_key = (
+                    device_data.get("firmware"),
+                    device_data.get("model"),
+                    device_data.get("rssi"),
+                    device_data.get("ssid"),
+                    device_data.get("ip"),
+                    device_data.get("version"),
+                )
+                if self._metadata_keys.get(device_id) != metadata_key:
+                    self._metadata_keys[device_id] = metadata_key
+                    self.device_metadata[device_id] = {
                         "firmware": device_data.get("firmware", "Unknown"),
                         "model": device_data.get("model", "Tinxy Smart Device"),
                         "rssi": device_data.get("rssi"),
@@ -55,47 +125,92 @@ class TinxyUpdateCoordinator(DataUpdateCoordinator):
                         "ip": device_data.get("ip"),
                         "version": device_data.get("version"),
                     }
-            except TinxyConnectionException as conn_err:
-                _LOGGER.error(
-                    "Connection error for node %s: %s", node["name"], conn_err
-                )
-                continue
-            except TinxyLocalException as node_err:
-                _LOGGER.error(
-                    "Error communicating with node %s: %s", node["name"], node_err
-                )
-                continue
 
         # Set `self.data` to `status_list` so entities can access it
         self.data = status_list
+        self.relay_index = {
+            (device_id, index + 1): device
+            for device_id, device_data in status_list.items()
+            for index, device in enumerate(device_data["devices"])
+        }
         _LOGGER.debug("Coordinator data updated: %s", self.data)
 
-        # Call the device registration method after the initial data fetch
-        await self._register_devices()
+        self._adjust_poll_interval(status_list)
+
+        # Register any devices not yet present in the device registry
+        if not self._devices_registered.issuperset(status_list):
+            await self._register_devices()
         return status_list
 
+    def _adjust_poll_interval(self, status_list: dict[str, Any]) -> None:
+        """Back the poll rate off while device states stay unchanged.
+
+        Only relay states and brightness enter the signature; rssi and other
+        metadata fluctuate constantly and would defeat the backoff.
+        """
+        signature = tuple(
+            (
+                device_id,
+                tuple(
+                    (device["status"], device.get("brightness"))
+                    for device in device_data["devices"]
+                ),
+            )
+            for device_id, device_data in status_list.items()
+        )
+        if signature == self._last_state_signature:
+            self._idle_cycles += 1
+            if self._idle_cycles >= IDLE_BACKOFF_CYCLES:
+                current = self.update_interval.total_seconds()
+                backed_off = min(MAX_IDLE_INTERVAL, current * 1.5)
+                if backed_off > current:
+                    self.update_interval = timedelta(seconds=backed_off)
+        else:
+            self._last_state_signature = signature
+            self._idle_cycles = 0
+            self.update_interval = timedelta(seconds=self._min_interval)
+
     def set_polling_interval(self, device_id: str, interval: int) -> None:
         """Set the polling interval for a specific device."""
         _LOGGER.debug("Setting polling interval for device %s to %d seconds", device_id, interval)
+        old_interval = self.device_polling_intervals.get(device_id)
         self.device_polling_intervals[device_id] = interval
-        self.update_interval = timedelta(
-            seconds=min(self.device_polling_intervals.values(), default=5)
-        )
+        if old_interval is not None:
+            self._interval_counts[old_interval] -= 1
+            if not self._interval_counts[old_interval]:
+                del self._interval_counts[old_interval]
+        self._interval_counts[interval] += 1
+        if interval <= self._min_interval:
+            self._min_interval = interval
+        elif self._min_interval not in self._interval_counts:
+            # The last device on the old minimum was raised; the next minimum
+            # is the smallest interval still in use.
+            self._min_interval = min(self._interval_counts, default=5)
+        self.update_interval = timedelta(seconds=self._min_interval)
 
     async def _register_devices(self):
         """Register devices in the Home Assistant device registry after data is loaded."""
+        pending = [
+            args
+            for args in self._registration_args
+            if args[0] not in self._devices_registered
+        ]
+        if not pending:
+            return
+
         device_registry = dr.async_get(self.hass)
-        for node in self.nodes:
-            metadata = self.device_metadata.get(node["device_id"], {})
+        for device_id, name, identifiers in pending:
+            metadata = self.device_metadata.get(device_id, {})
             firmware_version = metadata.get("firmware", "Unknown")
             model = metadata.get("model", "Tinxy Smart Device")
 
             # Only use identifiers without connections
             device_registry.async_get_or_create(
                 config_entry_id=self.config_entry.entry_id,
-                identifiers={(DOMAIN, node["device_id"])},
-                name=node["name"],
+                identifiers=identifiers,
+                name=name,
                 manufacturer="Tinxy",
                 model=model,
                 sw_version=firmware_version,
             )
+            self._devices_registered.add(device_id)
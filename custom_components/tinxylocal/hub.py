@@ -1,9 +1,16 @@
 """Module for interacting with Tinxy devices locally."""
 
+import asyncio
 import logging
+from operator import itemgetter
+import random
+import time
 
 import aiohttp
 
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
 from .const import TINXY_BACKEND
 
 # pylint: disable=no-name-in-module
@@ -14,6 +21,65 @@ _LOGGER = logging.getLogger(__name__)
 
 HEADERS = {"Content-Type": "application/json"}
 
+# Explicit per-request timeout: devices answer on the LAN or not at all.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=2, connect=1)
+
+# How long a generated device password may be reused. The password is
+# derived from the current time, so keep this conservative: long enough to
+# cover a burst of commands, short enough to stay within the device's
+# acceptance window.
+PASSWORD_TTL = 2.0
+
+# How long a fetched /info payload may be served to other callers. Long
+# enough to collapse same-tick refreshes, short enough never to mask a
+# state change between polls.
+INFO_CACHE_TTL = 0.25
+
+# Synced TinxyCloud clients keyed by api key, so repeated credential
+# checks (options flow, reloads) skip re-downloading the device list.
+CLOUD_CACHE_TTL = 300.0
+_CLOUD_CACHE: dict[str, tuple[float, TinxyCloud]] = {}
+
+# Device status characters to entity status strings.
+STATUS_MAP = {"1": "on"}
+
+# Toggle payload action values indexed by action int.
+ACTION_STR = ("0", "1")
+
+# Device types that carry a brightness value in /info responses.
+DIMMABLE_TYPES = frozenset({"light", "fan"})
+
+# Icons per device type; anything unknown falls back to a toggle switch.
+DEVICE_ICONS = {
+    "Heater": "mdi:radiator",
+    "Tubelight": "mdi:lightbulb-fluorescent-tube",
+    "LED Bulb": "mdi:lightbulb",
+    "Dimmable Light": "mdi:lightbulb",
+    "LED Dimmable Bulb": "mdi:lightbulb",
+    "Music System": "mdi:music",
+    "Fan": "mdi:fan",
+    "Socket": "mdi:power-socket-eu",
+    "TV": "mdi:television",
+    "Lock": "mdi:lock",
+}
+
+# Scalar fields copied verbatim from the /info payload.
+DEVICE_INFO_KEYS = (
+    "rssi",
+    "ip",
+    "version",
+    "status",
+    "chip_id",
+    "ssid",
+    "firmware",
+    "model",
+)
+_get_device_fields = itemgetter(*DEVICE_INFO_KEYS)
+
+# Transient statuses worth retrying with backoff instead of failing outright.
+RETRY_STATUSES = frozenset({429, 503})
+MAX_REQUEST_ATTEMPTS = 3
+
 
 class TinxyConnectionException(Exception):
     """Exception for connection errors with Tinxy devices."""
@@ -26,22 +92,41 @@ class TinxyLocalException(Exception):
 class TinxyLocalHub:
     """TinxyLocalHub class for interacting with Tinxy devices locally."""
 
-    def __init__(self, host: str) -> None:
-        """Initialize with the device host."""
+    def __init__(self, host: str, web_session) -> None:
+        """Initialize with the device host and a shared client session."""
         self.host = f"http://{host}"
+        self._session = web_session
+        # Fixed endpoint URLs, built once instead of per request
+        self._url_info = f"{self.host}/info"
+        self._url_toggle = f"{self.host}/toggle"
+        # In-flight toggle requests keyed by (relay_number, action), so
+        # duplicate commands to the same relay share one POST.
+        self._toggle_inflight: dict[tuple[int, int], asyncio.Task] = {}
+        # Recently generated device passwords keyed by mqtt password, and
+        # the reusable encryptor instances that produce them.
+        self._password_cache: dict[str, tuple[float, str]] = {}
+        self._encryptors: dict[str, PasswordEncryptor] = {}
+        # In-flight /info request shared by concurrent callers, plus the
+        # last fetched payload and its timestamp.
+        self._info_inflight: asyncio.Task | None = None
+        self._info_cache: tuple[float, dict] | None = None
 
-    async def authenticate(self, api_key: str, web_session) -> bool:
-        """Authenticate with the host."""
+    async def authenticate(self, api_key: str) -> bool:
+        """Authenticate with the host, reusing a recently synced client."""
+        cached = _CLOUD_CACHE.get(api_key)
+        if cached is not None and time.monotonic() - cached[0] < CLOUD_CACHE_TTL:
+            return True
         api = TinxyCloud(
             host_config=TinxyHostConfiguration(
                 api_token=api_key, api_url=TINXY_BACKEND
             ),
-            web_session=web_session,
+            web_session=self._session,
         )
         await api.sync_devices()
+        _CLOUD_CACHE[api_key] = (time.monotonic(), api)
         return True
 
-    async def validate_ip(self, web_session, chip_id=None) -> str:
+    async def validate_ip(self, chip_id=None) -> str:
         """Validate the device's local API by checking the /info endpoint.
 
         Returns:
@@ -52,7 +137,7 @@ class TinxyLocalHub:
 
         """
         try:
-            response = await self._send_request("GET", "/info", web_session=web_session)
+            response = await self._fetch_info()
             if response is not None:
                 if chip_id:
                     if response["chip_id"] == chip_id:
@@ -74,65 +159,131 @@ class TinxyLocalHub:
             raise TinxyConnectionException(f"Request error: status {response.status}")
         return None
 
-    async def _send_request(
-        self, method: str, endpoint: str, payload=None, web_session=None
-    ):
-        """Handle HTTP requests and error checking."""
-        url = f"{self.host}{endpoint}"
-
-        def handle_exception(message: str, exception: Exception | None):
-            _LOGGER.error(message)
-            raise TinxyConnectionException(message) from exception
+    async def _send_request(self, method: str, url: str, body: bytes | None = None):
+        """Handle HTTP requests and error checking.
 
-        try:
-            async with web_session.request(
-                method,
-                url=url,
-                json=payload if method == "POST" else None,
-                headers=HEADERS,
-                timeout=2,
-            ) as response:
-                if response.status == 200:
-                    return await response.json(content_type=None)
-                if response.status == 400:
-                    handle_exception(f"Request error: status {response.status}", None)
-                else:
-                    handle_exception(
-                        f"Unexpected error: status {response.status}", None
+        POST bodies arrive preserialized so aiohttp's JSON encoder stays
+        out of the hot path; HEADERS already declares the content type.
+        """
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            try:
+                async with self._session.request(
+                    method,
+                    url=url,
+                    data=body,
+                    headers=HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status == 200:
+                        # orjson-backed parse; the device does not always set
+                        # an application/json content type
+                        return json_loads(await response.read())
+                    if (
+                        response.status in RETRY_STATUSES
+                        and attempt < MAX_REQUEST_ATTEMPTS - 1
+                    ):
+                        # Device is busy; back off with jitter before retrying
+                        retry_after = response.headers.get("Retry-After")
+                        try:
+                            delay = float(retry_after)
+                        except (TypeError, ValueError):
+                            delay = 2**attempt + random.random()
+                        await asyncio.sleep(min(delay, 5))
+                        continue
+                    message = (
+                        f"Request error: status {response.status}"
+                        if response.status == 400
+                        else f"Unexpected error: status {response.status}"
                     )
-        except TimeoutError as e:
-            handle_exception(f"Request to {url} timed out", e)
-        except aiohttp.ClientError as e:
-            handle_exception(f"Client error for request to {url}: {e}", e)
-        except Exception as e:  # noqa: BLE001
-            handle_exception(f"Error for request to {url}: {e}", e)
-
-    async def tinxy_toggle(
-        self, mqttpass: str, relay_number: int, action: int, web_session
-    ) -> bool:
-        """Toggle Tinxy device state."""
+                    _LOGGER.error(message)
+                    raise TinxyConnectionException(message)
+            except TinxyConnectionException:
+                raise
+            except TimeoutError as e:
+                message = f"Request to {url} timed out"
+                _LOGGER.error(message)
+                raise TinxyConnectionException(message) from e
+            except aiohttp.ClientError as e:
+                message = f"Client error for request to {url}: {e}"
+                _LOGGER.error(message)
+                raise TinxyConnectionException(message) from e
+        return None
+
+    async def tinxy_toggle(self, mqttpass: str, relay_number: int, action: int) -> bool:
+        """Toggle Tinxy device state, sharing duplicate in-flight commands."""
         if action not in [0, 1]:
             _LOGGER.error("Action must be 0 (off) or 1 (on): %s", action)
             return False
 
+        key = (relay_number, action)
+        if (task := self._toggle_inflight.get(key)) is not None and not task.done():
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(self._do_toggle(mqttpass, relay_number, action))
+        self._toggle_inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._toggle_inflight.pop(key, None)
+
+    async def _encrypted_password(self, mqttpass: str) -> str:
+        """Return the encrypted device password, reusing a recent one.
+
+        Cache misses run the CPU-bound encryption in the default executor
+        so it never stalls the event loop.
+        """
+        now = time.monotonic()
+        cached = self._password_cache.get(mqttpass)
+        if cached is not None and now - cached[0] < PASSWORD_TTL:
+            return cached[1]
+        encryptor = self._encryptors.get(mqttpass)
+        if encryptor is None:
+            encryptor = self._encryptors[mqttpass] = PasswordEncryptor(mqttpass)
+        password = await asyncio.get_running_loop().run_in_executor(
+            None, encryptor.generate_password
+        )
+        self._password_cache[mqttpass] = (now, password)
+        return password
+
+    async def _do_toggle(self, mqttpass: str, relay_number: int, action: int) -> bool:
+        """Send a toggle command to the device."""
         payload = {
-            "password": PasswordEncryptor(mqttpass).generate_password(),
+            "password": await self._encrypted_password(mqttpass),
             "relayNumber": relay_number,
-            "action": str(action),
+            "action": ACTION_STR[action],
         }
 
         try:
-            return await self._send_request("POST", "/toggle", payload, web_session)
+            return await self._send_request("POST", self._url_toggle, json_bytes(payload))
         except TinxyConnectionException as e:
             _LOGGER.error("Error toggling device relay %s: %s", relay_number, e)
             return False
 
-    async def fetch_device_data(self, node, web_session):
+    async def _fetch_info(self):
+        """GET /info, sharing one in-flight request and a short-lived cache."""
+        if (
+            self._info_cache is not None
+            and time.monotonic() - self._info_cache[0] < INFO_CACHE_TTL
+        ):
+            return self._info_cache[1]
+
+        if self._info_inflight is not None and not self._info_inflight.done():
+            return await asyncio.shield(self._info_inflight)
+
+        task = asyncio.ensure_future(self._send_request("GET", self._url_info))
+        self._info_inflight = task
+        try:
+            device_data = await task
+        finally:
+            self._info_inflight = None
+        if device_data is not None:
+            self._info_cache = (time.monotonic(), device_data)
+        return device_data
+
+    async def fetch_device_data(self, node):
         """Fetch and decode device data."""
         try:
-            device_data = await self._send_request(
-                "GET", "/info", web_session=web_session
-            )
+            device_data = await self._fetch_info()
             return self._decode_device_data(device_data, node)
         except TinxyConnectionException as e:
             _LOGGER.error("Failed to update status for node %s: %s", node["name"], e)
@@ -145,56 +296,30 @@ class TinxyLocalHub:
 
     @staticmethod
     def _decode_device_data(data, node):
-        """Decode the device data."""
-        decoded_data = {
-            "rssi": data["rssi"],
-            "ip": data["ip"],
-            "version": data["version"],
-            "status": data["status"],
-            "chip_id": data["chip_id"],
-            "ssid": data["ssid"],
-            "firmware": data["firmware"],
-            "model": data["model"],
-            "devices": [],
-        }
+        """Decode the device data in a single pass over the state string."""
+        node_devices = node["devices"]
+        bright = data.get("bright")
 
-        state_array = [
-            {
-                "name": node["devices"][index]["name"],
-                "type": node["devices"][index]["type"],
-                "status": "on" if status == "1" else "off",
+        devices = []
+        for index, status in enumerate(data["state"]):
+            node_device = node_devices[index]
+            device = {
+                "name": node_device["name"],
+                "type": node_device["type"],
+                "status": STATUS_MAP.get(status, "off"),
             }
-            for index, status in enumerate(data["state"])
-        ]
-
-        if "bright" in data:
-            brightness_array = [
-                data["bright"][i : i + 3] for i in range(0, len(data["bright"]), 3)
-            ]
-            for index, device in enumerate(state_array):
-                if device["type"] in ["light", "fan"]:
-                    device["brightness"] = int(brightness_array[index] or "000", 10)
-
-        decoded_data["devices"] = state_array
+            if bright is not None and device["type"] in DIMMABLE_TYPES:
+                offset = index * 3
+                device["brightness"] = int(bright[offset : offset + 3] or "000", 10)
+            devices.append(device)
+
+        decoded_data = dict(
+            zip(DEVICE_INFO_KEYS, _get_device_fields(data), strict=True)
+        )
+        decoded_data["devices"] = devices
         return decoded_data
 
     @staticmethod
     def get_device_icon(device_type: str) -> str:
         """Generate an icon based on the device type."""
-        if device_type == "Heater":
-            return "mdi:radiator"
-        if device_type == "Tubelight":
-            return "mdi:lightbulb-fluorescent-tube"
-        if device_type in ["LED Bulb", "Dimmable Light", "LED Dimmable Bulb"]:
-            return "mdi:lightbulb"
-        if device_type == "Music System":
-            return "mdi:music"
-        if device_type == "Fan":
-            return "mdi:fan"
-        if device_type == "Socket":
-            return "mdi:power-socket-eu"
-        if device_type == "TV":
-            return "mdi:television"
-        if device_type == "Lock":
-            return "mdi:lock"
-        return "mdi:toggle-switch"
+        return DEVICE_ICONS.get(device_type, "mdi:toggle-switch")
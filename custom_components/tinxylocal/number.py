@@ -58,10 +58,15 @@ class TinxyPollingNumber(RestoreNumber, NumberEntity):
         return True
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set the polling interval."""
+        """Set the polling interval.
+
+        No refresh is requested here: dragging the slider can emit many
+        values per second, and the next scheduled poll already picks up
+        the new interval.
+        """
         self._attr_native_value = value
         self._coordinator.set_polling_interval(self._device_id, int(value))
-        await self._coordinator.async_request_refresh()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state on Home Assistant restart."""
@@ -1,13 +1,12 @@
 """Switch platform for Tinxy integration."""
 
-import asyncio
+from functools import lru_cache
 import logging
 from typing import Any, cast
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -20,6 +19,12 @@ from .hub import TinxyLocalHub
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _device_type_for(device_types: tuple[str, ...], index: int) -> str:
+    """Classify a relay's device type, cached across entry reloads."""
+    return device_types[index] if index < len(device_types) else "Socket"
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -29,29 +34,21 @@ async def async_setup_entry(
     )
     hubs = hass.data[DOMAIN][entry.entry_id]["hubs"]
 
-    switches = []
-    device_types = entry.data["device"].get("deviceTypes", [])
-    for node in coordinator.nodes:
-        device_name = node["name"]
-
-        for index, device in enumerate(node["devices"]):
-            if device["type"].lower():
-                relay_number = index + 1
-                entity_name = f"{device_name} {device['name']}"
-                device_type = (
-                    device_types[index] if index < len(device_types) else "Socket"
-                )
-                switch = TinxySwitch(
-                    coordinator=coordinator,
-                    hub=hubs[0],
-                    node_id=node["device_id"],
-                    relay_number=relay_number,
-                    name=entity_name,
-                    device_type=device_type,
-                )
-                switches.append(switch)
-
-    async_add_entities(switches)
+    device_types = tuple(entry.data["device"].get("deviceTypes", []))
+    async_add_entities(
+        TinxySwitch(
+            coordinator=coordinator,
+            hub=hubs[0],
+            node_id=node["device_id"],
+            relay_number=index + 1,
+            name=f"{node['name']} {device['name']}",
+            device_type=_device_type_for(device_types, index),
+            mqtt_password=node["mqtt_password"],
+        )
+        for node in coordinator.nodes
+        for index, device in enumerate(node["devices"])
+        if device.get("type")
+    )
 
 
 class TinxySwitch(CoordinatorEntity, SwitchEntity):
@@ -65,105 +62,91 @@ class TinxySwitch(CoordinatorEntity, SwitchEntity):
         relay_number: int,
         name: str,
         device_type: str,
+        mqtt_password: str,
     ) -> None:
         """Initialize the Tinxy switch."""
         super().__init__(coordinator)
-        self.coordinator = coordinator
         self.hub = hub
         self.node_id = node_id
         self.relay_number = relay_number
         self._attr_name = name
         self._attr_unique_id = f"{node_id}_{relay_number}"
         self._device_type = device_type
+        self._mqtt_password = mqtt_password
+        self._attr_icon = hub.get_device_icon(device_type)
+        self._relay_key = (node_id, relay_number)
+        self._device_snapshot: dict[str, Any] | None = None
+        self._available = False
+        self._device_short_name = name.split(" ", 1)[0] if name else "Unknown Device"
+        self._metadata_key: tuple[Any, Any] | None = None
+        self._refresh_device_info()
+        self._refresh_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this entity's slice of coordinator data, then write state."""
+        self._refresh_device_info()
+        self._refresh_snapshot()
+        super()._handle_coordinator_update()
+
+    def _refresh_device_info(self) -> None:
+        """Rebuild the device info dict only when its metadata changed."""
+        metadata = self.coordinator.device_metadata.get(self.node_id, {})
+        metadata_key = (metadata.get("model"), metadata.get("firmware"))
+        if metadata_key == self._metadata_key:
+            return
+        self._metadata_key = metadata_key
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.node_id)},
+            name=self._device_short_name,
+            manufacturer="Tinxy",
+            model=metadata.get("model", "Smart Device"),
+            sw_version=metadata.get("firmware", "Unknown"),
+        )
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for the entity."""
-        return self._attr_unique_id
+    def _refresh_snapshot(self) -> None:
+        """Re-resolve this relay's device entry from the coordinator index."""
+        self._device_snapshot = self.coordinator.relay_index.get(self._relay_key)
+        self._available = (
+            self._device_snapshot is not None
+            and self.node_id in self.coordinator.device_metadata
+        )
 
     @property
     def available(self) -> bool:
         """Return True if the device status data is available and valid."""
-        # Return False if coordinator data is None to handle cases where data has not yet loaded
-        if self.coordinator.data is None:
-            _LOGGER.warning(
-                "Coordinator data is not yet available for node %s", self.node_id
-            )
-            return False
-
-        node_data = self.coordinator.data.get(self.node_id, {})
-        return bool(node_data) and self.node_id in self.coordinator.device_metadata
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device information to associate entities with the device."""
-        metadata = self.coordinator.device_metadata.get(self.node_id, {})
-        device_name = (
-            self._attr_name.split(" ")[0] if self._attr_name else "Unknown Device"
-        )
-
-        return {
-            "identifiers": {(DOMAIN, self.node_id)},
-            "name": device_name,
-            "manufacturer": "Tinxy",
-            "model": metadata.get("model", "Smart Device"),
-            "sw_version": metadata.get("firmware", "Unknown"),
-        }
+        return self._available
 
     @property
     def is_on(self) -> bool | None:
         """Return the status of the switch."""
-        # Check if coordinator data is available and fetch data based on node_id
-        if self.coordinator.data is None:
-            _LOGGER.warning(
-                "Coordinator data is not available for node %s", self._attr_unique_id
-            )
-            return False  # Default to off if data is not available
-
-        node_data = self.coordinator.data.get(self.node_id, {})
-        if not node_data:
-            _LOGGER.warning("Node data is missing for node %s", self.node_id)
-            return False
-
-        # Access the device data within the node data
-        device_data = node_data.get("devices", [])
-
-        # Adjust for 1-based relay numbering
-        if len(device_data) >= self.relay_number:
-            return device_data[self.relay_number - 1].get("status") == "on"
-
-        _LOGGER.warning(
-            "Device data is unavailable for relay number %s in node %s",
-            self.relay_number,
-            self.node_id,
-        )
-        return False
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of the switch."""
-        return self.hub.get_device_icon(self._device_type)
+        snapshot = self._device_snapshot
+        return snapshot is not None and snapshot.get("status") == "on"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         result = await self.hub.tinxy_toggle(
-            mqttpass=self.coordinator.nodes[0]["mqtt_password"],
+            mqttpass=self._mqtt_password,
             relay_number=self.relay_number,
             action=1,
-            web_session=async_get_clientsession(self.coordinator.hass),
         )
         if result:
-            await asyncio.sleep(0.5)
+            self._set_optimistic_status("on")
             await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         result = await self.hub.tinxy_toggle(
-            mqttpass=self.coordinator.nodes[0]["mqtt_password"],
+            mqttpass=self._mqtt_password,
             relay_number=self.relay_number,
             action=0,
-            web_session=async_get_clientsession(self.coordinator.hass),
         )
         if result:
-            await asyncio.sleep(0.5)
+            self._set_optimistic_status("off")
             await self.coordinator.async_request_refresh()
+
+    def _set_optimistic_status(self, status: str) -> None:
+        """Reflect a successful command immediately; the refresh confirms it."""
+        if self._device_snapshot is not None:
+            self._device_snapshot["status"] = status
+        self.async_write_ha_state()
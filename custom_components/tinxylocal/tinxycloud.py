@@ -1,5 +1,8 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from pprint import pprint
+import logging
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class TinxyException(Exception):
@@ -15,7 +18,7 @@ class TinxyAuthenticationException(TinxyException):
     """Tinxy authentication exception."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TinxyHostConfiguration:
     """Tinxy host configuration."""
 
@@ -37,9 +40,8 @@ class TinxyCloud:
     """Tinxy Cloud."""
 
     DOMAIN = "tinxy"
-    devices = []
-    disabled_devices = ["EVA_HUB"]
-    enabled_list = [
+    disabled_devices = frozenset({"EVA_HUB"})
+    enabled_list = frozenset({
         "Dimmable Light",
         "EM_DOOR_LOCK",
         "EVA_BULB",
@@ -62,27 +64,34 @@ class TinxyCloud:
         "WIRED_DOOR_LOCK",
         "WIRED_DOOR_LOCK_V2",
         "WIRED_DOOR_LOCK_V3",
-    ]
+    })
 
-    gtype_light = ["action.devices.types.LIGHT"]
-    gtype_switch = ["action.devices.types.SWITCH"]
-    gtype_lock = ["action.devices.types.LOCK"]
-    typeId_fan = ["WIFI_3SWITCH_1FAN", "Fan", "WIFI_SWITCH_1FAN_V1"]
+    gtype_light = frozenset({"action.devices.types.LIGHT"})
+    gtype_switch = frozenset({"action.devices.types.SWITCH"})
+    gtype_lock = frozenset({"action.devices.types.LOCK"})
+    typeId_fan = frozenset({"WIFI_3SWITCH_1FAN", "Fan", "WIFI_SWITCH_1FAN_V1"})
 
     def __init__(self, host_config: TinxyHostConfiguration, web_session) -> None:
         """Init."""
         self.host_config = host_config
         self.web_session = web_session
+        # Request headers are constant per instance; build them once
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": "Bearer " + host_config.api_token,
+        }
+        # Instance state: a class-level devices list would leak entries
+        # across TinxyCloud instances.
+        self.devices: list[dict] = []
+        # Devices bucketed by device_type ("_lock" for gtype locks), built
+        # once per sync so the list_* accessors avoid rescanning.
+        self._by_kind: dict[str, list[dict]] = defaultdict(list)
 
     async def tinxy_request(self, path, payload=None, method="GET"):
         """Tinxy API request."""
 
-        pprint("new request to " + path)
+        _LOGGER.debug("New request to %s", path)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer " + self.host_config.api_token,
-        }
         if payload:
             payload["source"] = "Home Assistant"
 
@@ -92,7 +101,7 @@ class TinxyCloud:
             method=method,
             url=self.host_config.api_url + path,
             json=payload,
-            headers=headers,
+            headers=self._headers,
             timeout=10,
         ) as resp:
             return await resp.json()
@@ -125,28 +134,34 @@ class TinxyCloud:
         device_list = []
         result = await self.tinxy_request("v2/devices/")
         for item in result:
-            device_list = device_list + (self.parse_device(item))
+            device_list.extend(self.parse_device(item))
         self.devices = device_list
+        by_kind: dict[str, list[dict]] = defaultdict(list)
+        for device in device_list:
+            by_kind[device["device_type"]].append(device)
+            if device["gtype"] in self.gtype_lock:
+                by_kind["_lock"].append(device)
+        self._by_kind = by_kind
         return True
 
     def list_switches(self):
         """List switches."""
-        return [d for d in self.devices if d["device_type"] == "Switch"]
+        return self._by_kind["Switch"]
 
     def list_lights(self):
         """List light."""
-        return [d for d in self.devices if d["device_type"] == "Light"]
+        return self._by_kind["Light"]
 
     def list_all_devices(self):
         return self.devices
 
     def list_fans(self):
         """List fans."""
-        return [d for d in self.devices if d["device_type"] == "Fan"]
+        return self._by_kind["Fan"]
 
     def list_locks(self):
         """List lokcs."""
-        return [d for d in self.devices if d["gtype"] in self.gtype_lock]
+        return self._by_kind["_lock"]
 
     async def get_device_state(self, id, device_number):
         """Get device state."""
@@ -225,86 +240,66 @@ class TinxyCloud:
 
     def parse_device(self, data):
         """Parse device."""
-        devices = []
+        type_id = data["typeId"]
+        type_name = type_id["name"]
+        if type_name not in self.enabled_list:
+            if data["devices"]:
+                _LOGGER.debug("Unknown tinxy type %s", type_name)
+            return []
+
+        # Fields shared by every relay entry, resolved once per device
+        device_id = data["_id"]
+        device_name = data["name"]
+        gtype = type_id["gtype"]
+        traits = type_id["traits"]
+        long_name = type_id["long_name"]
+        device_info = self.get_device_info(data)
+        mqtt_pass = data.get("mqttPassword")  # Check if key exists
+        device_uuid = data.get("uuidRef", {}).get("uuid")
+
+        def _entry(relay_no, name, device_type, user_device_type, icon):
+            return {
+                "id": f"{device_id}-{relay_no}",
+                "device_id": device_id,
+                "name": name,
+                "relay_no": relay_no,
+                "gtype": gtype,
+                "traits": traits,
+                "device_type": device_type,
+                "user_device_type": user_device_type,
+                "device_desc": long_name,
+                "tinxy_type": type_name,
+                "icon": icon,
+                "device": device_info,
+                "mqtt_pass": mqtt_pass,
+                "device_uuid": device_uuid,
+            }
 
         # Handle single item devices
         if not data["devices"]:
-            # Handle eva EVA_BULB
-            if (
-                data["typeId"]["name"] in self.enabled_list
-                and data["typeId"]["name"] == "EVA_BULB"
-            ):
-                device_type = (
-                    "Light" if data["typeId"]["name"] == "EVA_BULB" else "Switch"
-                )
-                devices.append(
-                    {
-                        "id": data["_id"] + "-1",
-                        "device_id": data["_id"],
-                        "name": data["name"],
-                        "relay_no": 1,
-                        "gtype": data["typeId"]["gtype"],
-                        "traits": data["typeId"]["traits"],
-                        "device_type": device_type,
-                        "user_device_type": device_type,
-                        "device_desc": data["typeId"]["long_name"],
-                        "tinxy_type": data["typeId"]["name"],
-                        "icon": self.icon_generate(data["typeId"]["name"]),
-                        "device": self.get_device_info(data),
-                    }
-                )
+            # Handle eva EVA_BULB, which carries no local credentials
+            if type_name == "EVA_BULB":
+                entry = _entry(1, device_name, "Light", "Light", self.icon_generate(type_name))
+                del entry["mqtt_pass"], entry["device_uuid"]
+                return [entry]
             # Handle single node devices
-            elif data["typeId"]["name"] in self.enabled_list:
-                device_type = self.get_device_type(data["typeId"]["name"], 0)
-                devices.append(
-                    {
-                        "id": data["_id"] + "-1",
-                        "device_id": data["_id"],
-                        "name": data["name"],
-                        "relay_no": 1,
-                        "gtype": data["typeId"]["gtype"],
-                        "traits": data["typeId"]["traits"],
-                        "device_type": device_type,
-                        "user_device_type": device_type,
-                        "device_desc": data["typeId"]["long_name"],
-                        "tinxy_type": data["typeId"]["name"],
-                        "icon": self.icon_generate(device_type),
-                        "device": self.get_device_info(data),
-                        "mqtt_pass": data.get("mqttPassword"),  # Check if key exists
-                        "device_uuid": data.get("uuidRef", {}).get("uuid"),
-                    }
-                )
-            else:
-                pass
-                # print('unknown  ='+data['typeId']['name'])
-                # print(self.enabled_list)
+            device_type = self.get_device_type(type_name, 0)
+            return [
+                _entry(1, device_name, device_type, device_type, self.icon_generate(device_type))
+            ]
+
         # Handle multinode_devices
-        elif data["typeId"]["name"] in self.enabled_list:
-            for itemid, nodes in enumerate(data["devices"]):
-                devices.append(
-                    {
-                        "id": data["_id"] + "-" + str(itemid + 1),
-                        "device_id": data["_id"],
-                        "name": data["name"] + " " + nodes,
-                        "relay_no": itemid + 1,
-                        "gtype": data["typeId"]["gtype"],
-                        "traits": data["typeId"]["traits"],
-                        "device_type": self.get_device_type(
-                            data["typeId"]["name"], itemid
-                        ),
-                        "user_device_type": data["deviceTypes"][itemid],
-                        "device_desc": data["typeId"]["long_name"],
-                        "tinxy_type": data["typeId"]["name"],
-                        "icon": self.icon_generate(data["deviceTypes"][itemid]),
-                        "device": self.get_device_info(data),
-                        "mqtt_pass": data.get("mqttPassword"),  # Check if key exists
-                        "device_uuid": data.get("uuidRef", {}).get("uuid"),
-                    }
-                )
-        else:
-            print("unknown  =" + data["typeId"]["name"])
-            # print(self.enabled_list)
-        return devices
+        user_device_types = data["deviceTypes"]
+        return [
+            _entry(
+                itemid + 1,
+                f"{device_name} {node}",
+                self.get_device_type(type_name, itemid),
+                user_device_types[itemid],
+                self.icon_generate(user_device_types[itemid]),
+            )
+            for itemid, node in enumerate(data["devices"])
+        ]
 
     def get_device_type(self, tinxy_type, itemid):
         """Generate device type."""
@@ -7,63 +7,72 @@ import json
 class TinxyServiceListener(ServiceListener):
     def __init__(self):
         self.tinxy_devices = []  # To store Tinxy devices from the API
+        self.suffix_index = {}  # Devices keyed by the last 5 chars of _id
+        # One pooled session so probes reuse TCP connections instead of
+        # opening a fresh one per request
+        self.session = requests.Session()
 
     def add_service(self, zeroconf, service_type, name):
-        if name.startswith("tinxy"):
-            try:
-                info = zeroconf.get_service_info(service_type, name)
-                if info:
-                    device_id_suffix = name[5:10]
-                    matched_device = self.find_matching_device(device_id_suffix)
-                    if matched_device:
-                        ip_address = ".".join(map(str, info.addresses[0]))
-                        print(f"Service Name: {name}")
-                        print(f"Address: {ip_address}")
-                        print(
-                            f"Supports local control: {'Yes' if self.check_local_api(ip_address) else 'No'}"
-                        )
-                        print(f"Port: {info.port}")
-                        print(f"Device Name : {matched_device.get('name')}")
-                        print("--------------------------------------------------")
-                    else:
-                        print(f"No matching API device found for service: {name}")
-            except BadTypeInNameException:
-                print(f"Skipped service with invalid name or type: {name}")
+        # Bail out before any other work; most _http._tcp records on a
+        # busy LAN are not Tinxy devices
+        if not name.startswith("tinxy"):
+            return
+        try:
+            info = zeroconf.get_service_info(service_type, name)
+            if info:
+                device_id_suffix = name[5:10]
+                matched_device = self.find_matching_device(device_id_suffix)
+                if matched_device:
+                    ip_address = ".".join(map(str, info.addresses[0]))
+                    print(f"Service Name: {name}")
+                    print(f"Address: {ip_address}")
+                    print(
+                        f"Supports local control: {'Yes' if self.check_local_api(ip_address) else 'No'}"
+                    )
+                    print(f"Port: {info.port}")
+                    print(f"Device Name : {matched_device.get('name')}")
+                    print("--------------------------------------------------")
+                else:
+                    print(f"No matching API device found for service: {name}")
+        except BadTypeInNameException:
+            print(f"Skipped service with invalid name or type: {name}")
 
     def remove_service(self, zeroconf, service_type, name):
-        if name.startswith("tinxy"):
-            print(f"Service removed: {name}")
+        if not name.startswith("tinxy"):
+            return
+        print(f"Service removed: {name}")
 
     def get_tinxy_devices(self):
         url = "https://ha-backend.tinxy.in/v2/devices"
         token = input("Please enter your Bearer token: ")
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if response.status_code == 200:
             try:
                 self.tinxy_devices = response.json()
+                self.suffix_index = {
+                    device["_id"][-5:]: device for device in self.tinxy_devices
+                }
             except json.JSONDecodeError:
                 print("Failed to parse JSON response.")
         else:
             print(f"Failed to fetch devices. Status code: {response.status_code}")
 
     def find_matching_device(self, device_id_suffix):
-        for device in self.tinxy_devices:
-            if device["_id"][-5:] == device_id_suffix:
-                return device
-        return None
+        return self.suffix_index.get(device_id_suffix)
 
     def check_local_api(self, ip_address):
         try:
-            response = requests.get(f"http://{ip_address}/info", timeout=1)
+            response = self.session.get(f"http://{ip_address}/info", timeout=1)
             return response.status_code == 200
         except requests.RequestException:
             return False
 
     def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
-        if name.startswith("tinxy"):
-            print(f"Service {name} updated")
+        if not name.startswith("tinxy"):
+            return
+        print(f"Service {name} updated")
 
 
 zeroconf = Zeroconf()